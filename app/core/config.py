@@ -1,24 +1,49 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent.parent  # backend/
 ROOT_DIR = BASE_DIR.parent  # project root
 
-load_dotenv(BASE_DIR / ".env")
-
 
+@dataclass(frozen=True, slots=True)
 class Settings:
-    NVIDIA_API_KEY: str = os.getenv("NVIDIA_API_KEY", "")
-    NVIDIA_BASE_URL: str = os.getenv("NVIDIA_BASE_URL", "https://integrate.api.nvidia.com/v1")
-    MODEL_NAME: str = os.getenv("NVIDIA_MODEL", "meta/llama-3.1-70b-instruct")
-    RESUME_DIR: str = str(ROOT_DIR / "data" / "resumes")
+    NVIDIA_API_KEY: str
+    NVIDIA_BASE_URL: str
+    MODEL_NAME: str
+    NVIDIA_MAX_PARALLEL: int
+    RESUME_DIR: str
+
+    # Resume PDF parser processes per app worker
+    PDF_WORKERS: int
 
     # Google OAuth
-    GOOGLE_CLIENT_ID: str = os.getenv("GOOGLE_CLIENT_ID", "")
+    GOOGLE_CLIENT_ID: str
 
     # JWT
-    JWT_SECRET: str = os.getenv("JWT_SECRET", "change-this-to-a-random-secret-key")
-
-
-settings = Settings()
\ No newline at end of file
+    JWT_SECRET: str
+
+    # Shared state across workers (empty = in-process memory only)
+    REDIS_URL: str
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load .env once per process and freeze the resulting settings."""
+    load_dotenv(BASE_DIR / ".env")
+    return Settings(
+        NVIDIA_API_KEY=os.getenv("NVIDIA_API_KEY", ""),
+        NVIDIA_BASE_URL=os.getenv("NVIDIA_BASE_URL", "https://integrate.api.nvidia.com/v1"),
+        MODEL_NAME=os.getenv("NVIDIA_MODEL", "meta/llama-3.1-70b-instruct"),
+        NVIDIA_MAX_PARALLEL=int(os.getenv("NVIDIA_MAX_PARALLEL", "8")),
+        RESUME_DIR=str(ROOT_DIR / "data" / "resumes"),
+        PDF_WORKERS=int(os.getenv("PDF_WORKERS", "2")),
+        GOOGLE_CLIENT_ID=os.getenv("GOOGLE_CLIENT_ID", ""),
+        JWT_SECRET=os.getenv("JWT_SECRET", "change-this-to-a-random-secret-key"),
+        REDIS_URL=os.getenv("REDIS_URL", ""),
+    )
+
+
+settings = get_settings()
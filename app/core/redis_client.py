@@ -0,0 +1,15 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
+from .config import settings
+
+_redis: Optional[Redis] = None
+
+
+def get_redis() -> Optional[Redis]:
+    """Shared async Redis client, or None when REDIS_URL is not configured."""
+    global _redis
+    if _redis is None and settings.REDIS_URL:
+        _redis = Redis.from_url(settings.REDIS_URL)
+    return _redis
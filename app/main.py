@@ -1,17 +1,31 @@
-import sys
-from pathlib import Path
-
-# Add the app directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from routes.interview_routes import router as interview_router
-from routes.resume_routes import router as resume_router
-from routes.report_routes import router as report_router
-from routes.auth_routes import router as auth_router
+from .routes.interview_routes import router as interview_router
+from .routes.resume_routes import router as resume_router
+from .routes.report_routes import router as report_router
+from .routes.auth_routes import router as auth_router
+from .services.llm_client import close_client, warm_up
+from .services.memory_manager import flush_sessions
+from .services.resume_parser import shutdown_pdf_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Pay the LLM client's DNS/TLS setup at startup, not on the first request
+    await warm_up()
+    yield
+    await flush_sessions()
+    await close_client()
+    shutdown_pdf_pool()
 
-app = FastAPI(title="AI Interviewer", version="1.0.0")
+
+app = FastAPI(
+    title="AI Interviewer",
+    version="1.0.0",
+    lifespan=lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,5 +46,5 @@ app.include_router(report_router)
 
 
 @app.get("/")
-async def root():
+async def root() -> dict:
     return {"message": "AI Interviewer API is running"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 from pydantic import BaseModel
-from services.auth_service import verify_google_token, create_access_token, store_user
+from ..services.auth_service import verify_google_token, create_access_token, store_user
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
@@ -10,16 +10,16 @@ class GoogleLoginRequest(BaseModel):
 
 
 @router.post("/google")
-def google_login(req: GoogleLoginRequest):
+async def google_login(req: GoogleLoginRequest) -> dict:
     """
-    Verify Google ID token, store user in memory,
+    Verify Google ID token, store the user,
     and return a JWT access token.
     """
     # 1. Verify the Google token
-    user_info = verify_google_token(req.token)
+    user_info = await verify_google_token(req.token)
 
-    # 2. Store user in memory
-    user = store_user(user_info)
+    # 2. Store user (Redis when configured, else memory)
+    user = await store_user(user_info)
 
     # 3. Create JWT
     access_token = create_access_token({"email": user["email"], "name": user["name"]})
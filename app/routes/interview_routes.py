@@ -1,16 +1,22 @@
+import json
 import time
+
+import orjson
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from services.interview_engine import (
+from ..services.interview_engine import (
     generate_first_question,
     analyze_and_next_question,
-    generate_after_skip
+    stream_analyze_and_next_question,
+    generate_after_skip,
+    stream_after_skip
 )
-from services.memory_manager import (
-    get_session, update_session, add_question,
-    record_answer, record_skip, add_to_history
+from ..services.memory_manager import (
+    get_session, save_session, update_session, add_question,
+    record_answer, record_skip, add_to_history, history_text_with
 )
-from services.auth_service import get_current_user
+from ..services.auth_service import get_current_user
 
 router = APIRouter(prefix="/api/interview", tags=["interview"])
 
@@ -29,28 +35,29 @@ class SkipRequest(BaseModel):
 
 
 @router.post("/start")
-async def start_interview(req: StartRequest, current_user: dict = Depends(get_current_user)):
+async def start_interview(req: StartRequest, current_user: dict = Depends(get_current_user)) -> dict:
     """Start interview — generate first question from resume."""
-    session = get_session(req.session_id)
+    session = await get_session(req.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found. Please upload resume first.")
 
     if session.started:
         raise HTTPException(status_code=400, detail="Interview already started")
 
-    # Generate the FIRST question from resume
-    first_q = generate_first_question(session.resume_summary)
-    add_question(req.session_id, first_q["question"], first_q["category"])
+    # FIRST question from resume (normally prepared during upload)
+    first_q = session.first_question or await generate_first_question(session.resume_text)
+    add_question(session, first_q["question"], first_q["category"])
 
     update_session(
-        req.session_id,
+        session,
         started=True,
         start_time=time.time(),
         current_topic=first_q.get("topic", "introduction"),
         topic_question_count=1,
         weak_streak=0
     )
-    add_to_history(req.session_id, "interviewer", first_q["question"])
+    add_to_history(session, "interviewer", first_q["question"])
+    await save_session(session)
 
     return {
         "question": first_q["question"],
@@ -62,52 +69,42 @@ async def start_interview(req: StartRequest, current_user: dict = Depends(get_cu
     }
 
 
-@router.post("/answer")
-async def submit_answer(req: AnswerRequest, current_user: dict = Depends(get_current_user)):
-    """
-    CORE: Take user's answer → LLM analyzes it → generates next question based on analysis.
-    No predefined questions. Everything is dynamic.
-    """
-    session = get_session(req.session_id)
+async def _answerable_session(session_id: str):
+    """Load a session that is ready to accept an answer, or raise."""
+    session = await get_session(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     if not session.started:
         raise HTTPException(status_code=400, detail="Interview not started")
     if session.finished:
         raise HTTPException(status_code=400, detail="Interview already finished")
+    return session
 
-    current_idx = session.current_question_index
-    if current_idx >= len(session.questions):
-        update_session(req.session_id, finished=True, end_time=time.time())
-        return {
-            "analysis": "Interview complete!",
-            "next_question": None,
-            "question_number": current_idx,
-            "category": "",
-            "is_finished": True,
-            "score": 0
-        }
 
-    current_q = session.questions[current_idx]
+def _complete_interview(session, question_number: int) -> dict:
+    """Mark the interview finished when no question is waiting for an answer."""
+    update_session(session, finished=True, end_time=time.time())
+    return {
+        "analysis": "Interview complete!",
+        "next_question": None,
+        "question_number": question_number,
+        "category": "",
+        "is_finished": True,
+        "score": 0
+    }
 
-    # Record the answer in history
-    add_to_history(req.session_id, "candidate", req.answer)
 
-    # ═══ THE MAIN CALL: Analyze answer + generate next question ═══
-    result = analyze_and_next_question(
-        resume_data=session.resume_summary,
-        conversation_history=session.conversation_history,
-        current_topic=session.current_topic,
-        topic_question_count=session.topic_question_count,
-        total_questions_asked=len(session.questions),
-        total_weak_streak=session.weak_streak,
-    )
+def _apply_answer_result(req: AnswerRequest, session, result: dict) -> dict:
+    """Record the analyzed answer, advance the interview and build the response."""
+    # History only changes once the turn completes, so an abandoned stream
+    # (or a retry) doesn't leave extra candidate messages behind
+    add_to_history(session, "candidate", req.answer)
 
     score = result["score"]
     analysis = result["analysis"]
 
     # Record the answer with score
-    record_answer(req.session_id, req.answer, score, analysis)
+    record_answer(session, req.answer, score, analysis)
 
     # Update weak streak
     if score <= 5:
@@ -124,7 +121,7 @@ async def submit_answer(req: AnswerRequest, current_user: dict = Depends(get_cur
         new_topic_count = session.topic_question_count + 1
 
     update_session(
-        req.session_id,
+        session,
         current_topic=new_topic,
         topic_question_count=new_topic_count,
         weak_streak=new_weak_streak
@@ -132,11 +129,11 @@ async def submit_answer(req: AnswerRequest, current_user: dict = Depends(get_cur
 
     # Check if LLM wants to end
     if result.get("should_end", False):
-        update_session(req.session_id, finished=True, end_time=time.time())
+        update_session(session, finished=True, end_time=time.time())
         return {
             "analysis": analysis,
             "next_question": result["next_question"],
-            "question_number": len(session.questions),
+            "question_number": session.question_count,
             "category": result["category"],
             "is_finished": True,
             "score": score,
@@ -145,13 +142,13 @@ async def submit_answer(req: AnswerRequest, current_user: dict = Depends(get_cur
 
     # Store the next question
     next_question = result["next_question"]
-    add_question(req.session_id, next_question, result["category"])
-    add_to_history(req.session_id, "interviewer", next_question)
+    add_question(session, next_question, result["category"])
+    add_to_history(session, "interviewer", next_question)
 
     return {
         "analysis": analysis,
         "next_question": next_question,
-        "question_number": len(session.questions),
+        "question_number": session.question_count,
         "category": result["category"],
         "topic": new_topic,
         "is_finished": False,
@@ -159,38 +156,103 @@ async def submit_answer(req: AnswerRequest, current_user: dict = Depends(get_cur
     }
 
 
-@router.post("/skip")
-async def skip_question(req: SkipRequest, current_user: dict = Depends(get_current_user)):
-    """Skip → counts as weak, switch topic, possibly end if too many skips."""
-    session = get_session(req.session_id)
-    if not session:
-        raise HTTPException(status_code=404, detail="Session not found")
-    if not session.started:
-        raise HTTPException(status_code=400, detail="Interview not started")
-    if session.finished:
-        raise HTTPException(status_code=400, detail="Interview already finished")
+def _sse(event: str, data: dict) -> str:
+    try:
+        payload = orjson.dumps(data).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects lone surrogates; json escapes them instead of failing the stream
+        payload = json.dumps(data)
+    return f"event: {event}\ndata: {payload}\n\n"
 
-    # Record skip
-    record_skip(req.session_id)
 
-    # Increase weak streak
-    new_weak_streak = session.weak_streak + 1
-    update_session(req.session_id, weak_streak=new_weak_streak)
+@router.post("/answer")
+async def submit_answer(req: AnswerRequest, current_user: dict = Depends(get_current_user)) -> dict:
+    """
+    CORE: Take user's answer → LLM analyzes it → generates next question based on analysis.
+    No predefined questions. Everything is dynamic.
+    """
+    session = await _answerable_session(req.session_id)
 
-    # Generate next question (different topic)
-    result = generate_after_skip(
+    current_idx = session.current_question_index
+    if current_idx >= session.question_count:
+        response = _complete_interview(session, current_idx)
+        await save_session(session)
+        return response
+
+    # ═══ THE MAIN CALL: Analyze answer + generate next question ═══
+    result = await analyze_and_next_question(
         resume_data=session.resume_summary,
-        conversation_history=session.conversation_history,
-        total_questions_asked=len(session.questions),
-        total_weak_streak=new_weak_streak,
+        resume_prompt=session.resume_prompt,
+        conversation_text=history_text_with(session, "candidate", req.answer),
+        current_topic=session.current_topic,
+        topic_question_count=session.topic_question_count,
+        total_questions_asked=session.question_count,
+        total_weak_streak=session.weak_streak,
+    )
+
+    response = _apply_answer_result(req, session, result)
+    await save_session(session)
+    return response
+
+
+@router.post("/answer/stream")
+async def submit_answer_stream(req: AnswerRequest, current_user: dict = Depends(get_current_user)):
+    """
+    Same as /answer, but streamed as Server-Sent Events: `question` events carry
+    the next question as it is generated, and a final `result` event carries
+    the exact payload /answer would have returned.
+    """
+    session = await _answerable_session(req.session_id)
+
+    current_idx = session.current_question_index
+    if current_idx >= session.question_count:
+        result = _complete_interview(session, current_idx)
+        await save_session(session)
+
+        async def finished():
+            yield _sse("result", result)
+
+        return StreamingResponse(finished(), media_type="text/event-stream")
+
+    async def events():
+        async for kind, payload in stream_analyze_and_next_question(
+            resume_data=session.resume_summary,
+            resume_prompt=session.resume_prompt,
+            conversation_text=history_text_with(session, "candidate", req.answer),
+            current_topic=session.current_topic,
+            topic_question_count=session.topic_question_count,
+            total_questions_asked=session.question_count,
+            total_weak_streak=session.weak_streak,
+        ):
+            if kind == "question":
+                yield _sse("question", {"delta": payload})
+            else:
+                response = _apply_answer_result(req, session, payload)
+                await save_session(session)
+                yield _sse("result", response)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
+
+def _apply_skip_result(req: SkipRequest, session, result: dict) -> dict:
+    """Record the skip, store the next question (or finish the interview) and build the response."""
+    # Nothing changes until the turn completes, so an abandoned stream leaves
+    # the skipped question still waiting for an answer
+    record_skip(session)
+
+    # Increase weak streak
+    update_session(session, weak_streak=session.weak_streak + 1)
+
     # Check if should end
     if result.get("should_end", False):
-        update_session(req.session_id, finished=True, end_time=time.time())
+        update_session(session, finished=True, end_time=time.time())
         return {
             "next_question": result["next_question"],
-            "question_number": len(session.questions),
+            "question_number": session.question_count,
             "category": "general",
             "is_finished": True,
             "end_reason": result.get("end_reason", "")
@@ -199,30 +261,77 @@ async def skip_question(req: SkipRequest, current_user: dict = Depends(get_curre
     # Store new question
     next_question = result["next_question"]
     new_topic = result.get("topic", "new_topic")
-    add_question(req.session_id, next_question, result["category"])
-    add_to_history(req.session_id, "interviewer", next_question)
+    add_question(session, next_question, result["category"])
+    add_to_history(session, "interviewer", next_question)
 
     update_session(
-        req.session_id,
+        session,
         current_topic=new_topic,
         topic_question_count=1
     )
 
     return {
         "next_question": next_question,
-        "question_number": len(session.questions),
+        "question_number": session.question_count,
         "category": result["category"],
         "topic": new_topic,
         "is_finished": False
     }
 
 
+@router.post("/skip")
+async def skip_question(req: SkipRequest, current_user: dict = Depends(get_current_user)) -> dict:
+    """Skip → counts as weak, switch topic, possibly end if too many skips."""
+    session = await _answerable_session(req.session_id)
+
+    # Generate next question (different topic)
+    result = await generate_after_skip(
+        resume_data=session.resume_summary,
+        skip_profile=session.skip_profile,
+        conversation_history=session.conversation_history,
+        total_questions_asked=session.question_count,
+        total_weak_streak=session.weak_streak + 1,
+    )
+
+    response = _apply_skip_result(req, session, result)
+    await save_session(session)
+    return response
+
+
+@router.post("/skip/stream")
+async def skip_question_stream(req: SkipRequest, current_user: dict = Depends(get_current_user)):
+    """Same as /skip, streamed as Server-Sent Events like /answer/stream."""
+    session = await _answerable_session(req.session_id)
+
+    async def events():
+        async for kind, payload in stream_after_skip(
+            resume_data=session.resume_summary,
+            skip_profile=session.skip_profile,
+            conversation_history=session.conversation_history,
+            total_questions_asked=session.question_count,
+            total_weak_streak=session.weak_streak + 1,
+        ):
+            if kind == "question":
+                yield _sse("question", {"delta": payload})
+            else:
+                response = _apply_skip_result(req, session, payload)
+                await save_session(session)
+                yield _sse("result", response)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/end")
-async def end_interview(req: SkipRequest, current_user: dict = Depends(get_current_user)):
+async def end_interview(req: SkipRequest, current_user: dict = Depends(get_current_user)) -> dict:
     """End the interview early (user pressed end)."""
-    session = get_session(req.session_id)
+    session = await get_session(req.session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    update_session(req.session_id, finished=True, end_time=time.time())
+    update_session(session, finished=True, end_time=time.time())
+    await save_session(session)
     return {"message": "Interview ended", "session_id": req.session_id}
@@ -1,10 +1,13 @@
+import asyncio
 from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from services.resume_parser import extract_text_from_pdf, save_resume
-from services.rag_engine import store_resume_chunks
-from services.interview_engine import analyze_resume
-from services.memory_manager import create_session, update_session
-from services.auth_service import get_current_user
-from core.config import settings
+from ..services.resume_parser import extract_text_from_pdf_async, save_resume_async
+from ..services.rag_engine import store_resume_chunks
+from ..services.interview_engine import (
+    analyze_resume, compress_resume, compress_skip_profile, generate_first_question
+)
+from ..services.memory_manager import create_session, save_session, update_session
+from ..services.auth_service import get_current_user
+from ..core.config import settings
 
 router = APIRouter(prefix="/api", tags=["resume"])
 
@@ -13,7 +16,7 @@ router = APIRouter(prefix="/api", tags=["resume"])
 async def upload_resume(
     file: UploadFile = File(...),
     current_user: dict = Depends(get_current_user),
-):
+) -> dict:
     """Upload and analyze a resume (requires authentication)."""
     if not file.filename:
         raise HTTPException(status_code=400, detail="No file provided")
@@ -23,25 +26,37 @@ async def upload_resume(
 
     try:
         # Create session
-        session_id = create_session()
+        session = create_session()
+        session_id = session.session_id
 
         # Save file
         content = await file.read()
-        file_path = save_resume(content, f"{session_id}_{file.filename}", settings.RESUME_DIR)
+        file_path = await save_resume_async(content, f"{session_id}_{file.filename}", settings.RESUME_DIR)
 
         # Extract text
-        resume_text = extract_text_from_pdf(file_path)
+        resume_text = await extract_text_from_pdf_async(file_path)
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="Could not extract text from PDF")
 
         # Store in vector DB for RAG
         store_resume_chunks(session_id, resume_text)
 
-        # Analyze resume with LLM
-        resume_data = analyze_resume(resume_text)
+        # Analyze resume and prepare the opening question concurrently
+        resume_data, first_question = await asyncio.gather(
+            analyze_resume(resume_text),
+            generate_first_question(resume_text),
+        )
 
-        # Update session
-        update_session(session_id, resume_text=resume_text, resume_summary=resume_data)
+        # Update session (with the compact profile reused by every interview turn)
+        update_session(
+            session,
+            resume_text=resume_text,
+            resume_summary=resume_data,
+            resume_prompt=compress_resume(resume_data),
+            skip_profile=compress_skip_profile(resume_data),
+            first_question=first_question,
+        )
+        await save_session(session)
 
         return {
             "session_id": session_id,
@@ -1,29 +1,50 @@
+import asyncio
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict
+from typing import Dict, Optional
 
+import requests
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 from jose import jwt, JWTError
 
-from core.config import settings
+from ..core.config import settings
+from ..core.redis_client import get_redis
 
 security = HTTPBearer()
 
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_HOURS = 24 * 7  # 7 days
 
-# In-memory user store (keyed by email)
+# In-memory user store (keyed by email), used when Redis is not configured
 _users: Dict[str, dict] = {}
 
+# Local read-through cache in front of the Redis user hashes
+_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
 
-def verify_google_token(token: str) -> dict:
-    """Verify Google ID token and return user info."""
+# Verified JWT payloads keyed by raw token, so repeat requests skip the HMAC check
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=300)
+_token_cache_lock = threading.Lock()
+
+# Shared transport so cert fetches reuse a pooled keep-alive connection to Google
+_google_request = google_requests.Request(session=requests.Session())
+
+
+async def verify_google_token(token: str) -> dict:
+    """Verify Google ID token and return user info (off the event loop)."""
+    return await asyncio.to_thread(_verify_google_token_sync, token)
+
+
+def _verify_google_token_sync(token: str) -> dict:
+    """Blocking cert fetch + RSA signature check for a Google ID token."""
     try:
         idinfo = id_token.verify_oauth2_token(
             token,
-            google_requests.Request(),
+            _google_request,
             settings.GOOGLE_CLIENT_ID,
         )
         if idinfo["iss"] not in ("accounts.google.com", "https://accounts.google.com"):
@@ -49,37 +70,70 @@ def create_access_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=ALGORITHM)
 
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-) -> dict:
-    """Dependency: extract and validate current user from JWT token."""
-    token = credentials.credentials
+def _decode_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing the cached payload until it expires."""
+    with _token_cache_lock:
+        payload = _token_cache.get(token)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGORITHM])
-        email: str = payload.get("email")
-        name: str = payload.get("name", "")
-        if email is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token: no email",
-            )
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
 
-    # Return user info from JWT payload (or in-memory cache)
-    user = _users.get(email, {"email": email, "name": name, "picture": ""})
+    with _token_cache_lock:
+        _token_cache[token] = payload
+    return payload
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+) -> dict:
+    """Dependency: extract and validate current user from JWT token."""
+    token = credentials.credentials
+    payload = _decode_token(token)
+    email: str = payload.get("email")
+    name: str = payload.get("name", "")
+    if email is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token: no email",
+        )
+
+    # Return user info from the user store, or fall back to the JWT payload
+    user = await _load_user(email)
+    return user or {"email": email, "name": name, "picture": ""}
+
+
+async def _load_user(email: str) -> Optional[dict]:
+    redis = get_redis()
+    if not redis:
+        return _users.get(email)
+
+    user = _user_cache.get(email)
+    if user is None:
+        raw = await redis.hgetall(f"user:{email}")
+        if raw:
+            user = {k.decode(): v.decode() for k, v in raw.items()}
+            _user_cache[email] = user
     return user
 
 
-def store_user(user_info: dict) -> dict:
-    """Store user info in memory. Returns the user dict."""
+async def store_user(user_info: dict) -> dict:
+    """Store user info (Redis hash when configured, else memory). Returns the user dict."""
     user = {
         "email": user_info["email"],
         "name": user_info["name"],
         "picture": user_info.get("picture", ""),
     }
-    _users[user_info["email"]] = user
+    redis = get_redis()
+    if redis:
+        await redis.hset(f"user:{user['email']}", mapping=user)
+        _user_cache[user["email"]] = user
+    else:
+        _users[user["email"]] = user
     return user
@@ -1,42 +1,18 @@
-import json
-from openai import OpenAI
-from core.config import settings
+import re
+from functools import partial
 
-_client = None
+import orjson
+from ..core.config import settings
+from .llm_cache import LLMCache
+from .llm_client import create_completion, get_client
+from .single_flight import SingleFlight
 
+_cache = LLMCache(maxsize=1024)
 
-def get_client():
-    global _client
-    if _client is None and settings.NVIDIA_API_KEY and settings.NVIDIA_API_KEY != "your_nvidia_api_key_here":
-        _client = OpenAI(
-            base_url=settings.NVIDIA_BASE_URL,
-            api_key=settings.NVIDIA_API_KEY,
-            timeout=30
-        )
-    return _client
+# Leading ```json / trailing ``` fences the model sometimes wraps JSON in
+_FENCE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
 
-
-def _generate(prompt: str) -> str:
-    """Generate content using NVIDIA API."""
-    client = get_client()
-    if not client:
-        return ""
-    response = client.chat.completions.create(
-        model=settings.MODEL_NAME,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.7,
-        max_tokens=2048
-    )
-    return response.choices[0].message.content.strip() if response.choices else ""
-
-
-def evaluate_answer(question: str, answer: str, category: str) -> dict:
-    """Evaluate an interview answer using LLM with detailed analysis."""
-    client = get_client()
-    if not client:
-        return _fallback_evaluate(answer)
-
-    prompt = f"""You are an expert interviewer evaluating a candidate's answer.
+_EVAL_TEMPLATE = """You are an expert interviewer evaluating a candidate's answer.
 
 Question: {question}
 Category: {category}
@@ -64,12 +40,58 @@ Scoring guide:
 - 8-9: Excellent, detailed and insightful
 - 10: Outstanding, exceptional answer"""
 
+_FEEDBACK_TEMPLATE = """Based on this interview performance, provide a 2-3 sentence overall feedback:
+
+{summary}
+
+Average Score: {avg_score:.1f}/10
+Total Questions: {total}
+Answered: {answered}
+Skipped: {skipped}
+
+Provide constructive, encouraging feedback."""
+
+
+async def _generate(prompt: str, tag: str = "") -> str:
+    """
+    Generate content using NVIDIA API.
+
+    Completions are cached per tag on the exact prompt only: grades and
+    feedback depend on every word, score and count in it.
+    """
+    client = get_client()
+    if not client:
+        return ""
+    cached = _cache.get(prompt, tag=tag)
+    if cached is not None:
+        return cached
+    text = await create_completion(
+        client,
+        model=settings.MODEL_NAME,
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.7,
+        max_tokens=2048
+    )
+    text = text.strip()
+    _cache.put(prompt, text, tag=tag)
+    return text
+
+
+# Identical feedback requests running at the same time share one LLM call
+_feedback_flight = SingleFlight(partial(_generate, tag="feedback"))
+
+
+async def evaluate_answer(question: str, answer: str, category: str) -> dict:
+    """Evaluate an interview answer using LLM with detailed analysis."""
+    client = get_client()
+    if not client:
+        return _fallback_evaluate(answer)
+
+    prompt = _EVAL_TEMPLATE.format(question=question, category=category, answer=answer)
+
     try:
-        text = _generate(prompt)
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-            text = text.rsplit("```", 1)[0]
-        result = json.loads(text)
+        text = await _generate(prompt, tag="evaluate")
+        result = orjson.loads(_FENCE.sub("", text))
         return {
             "score": min(max(int(result.get("score", 5)), 1), 10),
             "feedback": result.get("feedback", "Answer recorded.")
@@ -81,7 +103,8 @@ Scoring guide:
 
 def _fallback_evaluate(answer: str) -> dict:
     """Fallback evaluation without LLM."""
-    word_count = len(answer.split())
+    # Approximate word count without allocating a token list
+    word_count = answer.count(" ") + 1 if answer else 0
     if word_count < 5:
         return {"score": 3, "feedback": "Answer was too brief. Try to elaborate more."}
     elif word_count < 20:
@@ -92,15 +115,27 @@ def _fallback_evaluate(answer: str) -> dict:
         return {"score": 8, "feedback": "Detailed and comprehensive answer."}
 
 
-def generate_overall_feedback(results: list) -> str:
+async def generate_overall_feedback(results: list) -> str:
     """Generate overall interview feedback."""
     client = get_client()
 
-    answered = [r for r in results if not r.get("skipped")]
+    # Single pass: answered count, score total and the prompt summary lines
+    answered = 0
+    score_total = 0
+    summary_lines = []
+    for i, r in enumerate(results):
+        if not r.get("skipped"):
+            answered += 1
+            score_total += r["score"]
+        if client and i < 10:
+            summary_lines.append(
+                f"Q{r['question_number']}: {r['question']}\nA: {r.get('answer', 'Skipped')}\nScore: {r['score']}/10"
+            )
+
     if not answered:
         return "No questions were answered in this interview."
 
-    avg_score = sum(r["score"] for r in answered) / len(answered)
+    avg_score = score_total / answered
 
     if not client:
         if avg_score >= 8:
@@ -112,24 +147,18 @@ def generate_overall_feedback(results: list) -> str:
         else:
             return "Needs improvement. Focus on building deeper knowledge and practicing your responses."
 
-    summary = "\n".join([
-        f"Q{r['question_number']}: {r['question']}\nA: {r.get('answer', 'Skipped')}\nScore: {r['score']}/10"
-        for r in results[:10]
-    ])
-
-    prompt = f"""Based on this interview performance, provide a 2-3 sentence overall feedback:
+    summary = "\n".join(summary_lines)
 
-{summary}
-
-Average Score: {avg_score:.1f}/10
-Total Questions: {len(results)}
-Answered: {len(answered)}
-Skipped: {len(results) - len(answered)}
-
-Provide constructive, encouraging feedback."""
+    prompt = _FEEDBACK_TEMPLATE.format(
+        summary=summary,
+        avg_score=avg_score,
+        total=len(results),
+        answered=answered,
+        skipped=len(results) - answered,
+    )
 
     try:
-        text = _generate(prompt)
+        text = await _feedback_flight.submit(prompt)
         return text if text else f"Interview completed with an average score of {avg_score:.1f}/10."
     except Exception:
         return f"Interview completed with an average score of {avg_score:.1f}/10."
\ No newline at end of file
@@ -1,49 +1,184 @@
-import json
-from openai import OpenAI
-from core.config import settings
+import asyncio
+import re
+from typing import Iterable, List, Optional
 
-_client = None
+try:
+    import ahocorasick
+except ImportError:  # optional: _fallback_analyze falls back to substring checks
+    ahocorasick = None
 
+import msgspec
+from ..core.config import settings
+from .llm_cache import LLMCache
+from .llm_client import create_completion, get_client, stream_completion
 
-def get_client():
-    global _client
-    if _client is None and settings.NVIDIA_API_KEY and settings.NVIDIA_API_KEY != "your_nvidia_api_key_here":
-        _client = OpenAI(
-            base_url=settings.NVIDIA_BASE_URL,
-            api_key=settings.NVIDIA_API_KEY,
-            timeout=30
-        )
-    return _client
+_cache = LLMCache(maxsize=1024)
+
+
+def _messages(prompt: str, system: str) -> list:
+    if system:
+        return [{"role": "system", "content": system}, {"role": "user", "content": prompt}]
+    return [{"role": "user", "content": prompt}]
 
 
-def _generate(prompt: str) -> str:
-    """Generate content using NVIDIA API."""
+async def _generate(prompt: str, tag: str = "", system: str = "") -> str:
+    """
+    Generate content using NVIDIA API.
+
+    Completions are cached per prompt kind (`tag`) so different tasks never
+    share entries; only an identical prompt is ever reused.
+    A tag always uses the same `system` message, so the user prompt is the key.
+    """
     client = get_client()
     if not client:
         return ""
-    response = client.chat.completions.create(
+    cached = _cache.get(prompt, tag=tag)
+    if cached is not None:
+        return cached
+    text = await create_completion(
+        client,
         model=settings.MODEL_NAME,
-        messages=[{"role": "user", "content": prompt}],
+        messages=_messages(prompt, system),
         temperature=0.7,
         max_tokens=2048
     )
-    return response.choices[0].message.content.strip() if response.choices else ""
+    text = text.strip()
+    _cache.put(prompt, text, tag=tag)
+    return text
+
+
+async def _generate_stream(prompt: str, system: str = ""):
+    """Stream content deltas from the NVIDIA API as they are generated."""
+    client = get_client()
+    if not client:
+        return
+    async for delta in stream_completion(
+        client,
+        model=settings.MODEL_NAME,
+        messages=_messages(prompt, system),
+        temperature=0.7,
+        max_tokens=2048
+    ):
+        yield delta
+
+
+_JSON_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+
+class _JsonFieldStreamer:
+    """Incrementally pull one string field's value out of streamed JSON text."""
+
+    def __init__(self, field: str):
+        self._key = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._buf = ""
+        self._state = "search"  # search -> value -> done
+
+    def feed(self, chunk: str) -> str:
+        """Consume a chunk and return any newly decoded characters of the value."""
+        if self._state == "done":
+            return ""
+        self._buf += chunk
+        if self._state == "search":
+            match = self._key.search(self._buf)
+            if not match:
+                return ""
+            self._buf = self._buf[match.end():]
+            self._state = "value"
+
+        buf, out, i = self._buf, [], 0
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self._state = "done"
+                break
+            if ch == "\\":
+                # Wait for the rest of the escape sequence before decoding it
+                if i + 1 >= len(buf) or (buf[i + 1] == "u" and i + 6 > len(buf)):
+                    break
+                if buf[i + 1] == "u":
+                    code = int(buf[i + 2:i + 6], 16)
+                    if 0xD800 <= code <= 0xDBFF:
+                        # High surrogate: pair it with the \uDCxx escape that should follow
+                        low = buf[i + 6:i + 12]
+                        if len(low) < 6 and "\\u".startswith(low[:2]):
+                            break
+                        if low[:2] == "\\u" and 0xDC00 <= int(low[2:], 16) <= 0xDFFF:
+                            out.append(chr(0x10000 + ((code - 0xD800) << 10) + (int(low[2:], 16) - 0xDC00)))
+                            i += 12
+                            continue
+                        code = 0xFFFD
+                    elif 0xDC00 <= code <= 0xDFFF:
+                        code = 0xFFFD  # lone low surrogate
+                    out.append(chr(code))
+                    i += 6
+                else:
+                    out.append(_JSON_ESCAPES.get(buf[i + 1], buf[i + 1]))
+                    i += 2
+                continue
+            out.append(ch)
+            i += 1
+        self._buf = "" if self._state == "done" else buf[i:]
+        return "".join(out)
+
+
+# Typed schemas for the LLM's JSON replies. Decoding straight into these only
+# materialises the declared fields, fills defaults for missing ones, and
+# (with strict=False) accepts numbers sent as strings.
+class _FirstQuestion(msgspec.Struct):
+    question: str = "Tell me about yourself and your background."
+    category: str = "general"
+    topic: str = "introduction"
+
+
+class _ScoreResult(msgspec.Struct):
+    analysis: str = "Answer analyzed."
+    score: float = 5
+    should_end: bool = False
+    end_reason: Optional[str] = ""
+
+
+class _NextQuestion(msgspec.Struct):
+    next_question: str = "Can you tell me more about that?"
+    category: str = "general"
+    topic: Optional[str] = None
+
+
+class _SkipQuestion(msgspec.Struct):
+    next_question: str = "Tell me about another project you worked on."
+    category: str = "general"
+    topic: str = "new_topic"
+
+
+_RESUME_DECODER = msgspec.json.Decoder(dict)
+_FIRST_QUESTION_DECODER = msgspec.json.Decoder(_FirstQuestion, strict=False)
+_SCORE_DECODER = msgspec.json.Decoder(_ScoreResult, strict=False)
+_NEXT_QUESTION_DECODER = msgspec.json.Decoder(_NextQuestion, strict=False)
+_SKIP_DECODER = msgspec.json.Decoder(_SkipQuestion, strict=False)
 
 
 def _clean_json(text: str) -> str:
     """Remove markdown code fences from LLM JSON output."""
     text = text.strip()
-    if text.startswith("```"):
-        text = text.split("\n", 1)[1] if "\n" in text else text[3:]
-        text = text.rsplit("```", 1)[0]
+    if not text.startswith("```"):
+        return text
+    text = text.split("\n", 1)[1] if "\n" in text else text[3:]
+    text = text.rsplit("```", 1)[0]
     return text.strip()
 
 
+def _decode_json(decoder: msgspec.json.Decoder, text: str):
+    """Decode an LLM reply, only cleaning it up when the raw text isn't plain JSON."""
+    try:
+        return decoder.decode(text)
+    except msgspec.DecodeError:
+        return decoder.decode(_clean_json(text))
+
+
 # ─────────────────────────────────────────
 # Resume Analysis
 # ─────────────────────────────────────────
 
-def analyze_resume(resume_text: str) -> dict:
+async def analyze_resume(resume_text: str) -> dict:
     """Use LLM to analyze resume and extract structured data."""
     client = get_client()
     if not client:
@@ -67,23 +202,55 @@ Resume:
 {resume_text}"""
 
     try:
-        text = _generate(prompt)
-        text = _clean_json(text)
-        return json.loads(text)
+        text = await _generate(prompt, tag="analyze")
+        return _decode_json(_RESUME_DECODER, text)
     except Exception as e:
         print(f"Resume analysis error: {e}")
         return _fallback_analyze(resume_text)
 
 
+async def analyze_resumes_batch(texts: List[str], max_concurrency: int = 8) -> List[dict]:
+    """
+    Analyze many resumes concurrently (bulk screening / re-scoring).
+
+    Results come back in input order. At most `max_concurrency` analyses from
+    this batch are in flight at once, on top of the client-wide request cap
+    and retry/backoff in llm_client.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _one(text: str) -> dict:
+        async with semaphore:
+            return await analyze_resume(text)
+
+    return await asyncio.gather(*(_one(text) for text in texts))
+
+
+_COMMON_SKILLS = [
+    "python", "javascript", "react", "node", "java", "c++", "sql",
+    "html", "css", "typescript", "mongodb", "docker", "aws", "git",
+    "machine learning", "deep learning", "flask", "django", "fastapi",
+    "angular", "vue", "express", "postgresql", "mysql", "redis",
+    "kubernetes", "linux", "rust", "go", "swift", "kotlin"
+]
+
+# One automaton for all skills: a single pass over the resume finds every
+# (substring) occurrence instead of scanning the text once per skill
+_SKILL_AUTOMATON = None
+if ahocorasick is not None:
+    _SKILL_AUTOMATON = ahocorasick.Automaton()
+    for _skill in _COMMON_SKILLS:
+        _SKILL_AUTOMATON.add_word(_skill, _skill)
+    _SKILL_AUTOMATON.make_automaton()
+
+
 def _fallback_analyze(text: str) -> dict:
-    common_skills = [
-        "python", "javascript", "react", "node", "java", "c++", "sql",
-        "html", "css", "typescript", "mongodb", "docker", "aws", "git",
-        "machine learning", "deep learning", "flask", "django", "fastapi",
-        "angular", "vue", "express", "postgresql", "mysql", "redis",
-        "kubernetes", "linux", "rust", "go", "swift", "kotlin"
-    ]
-    found_skills = [s.title() for s in common_skills if s in text.lower()]
+    low = text.lower()
+    if _SKILL_AUTOMATON is not None:
+        found = {skill for _, skill in _SKILL_AUTOMATON.iter(low)}
+        found_skills = [s.title() for s in _COMMON_SKILLS if s in found]
+    else:
+        found_skills = [s.title() for s in _COMMON_SKILLS if s in low]
     return {
         "name": "", "email": "", "phone": "",
         "skills": found_skills if found_skills else ["General Programming"],
@@ -95,26 +262,65 @@ def _fallback_analyze(text: str) -> dict:
     }
 
 
+# Limits for the profile block re-sent on every turn
+_MAX_PROMPT_SKILLS = 15
+_MAX_PROMPT_ITEMS = 5
+_MAX_PROMPT_ITEM_CHARS = 160
+
+
+def _profile_items(resume_data: dict, key: str, limit: int) -> str:
+    return ", ".join(
+        str(item)[:_MAX_PROMPT_ITEM_CHARS]
+        for item in resume_data.get(key, [])[:limit]
+    )
+
+
+def compress_resume(resume_data: dict) -> str:
+    """
+    Build the compact candidate-profile block used in per-turn prompts.
+
+    Computed once at upload so each turn re-sends a trimmed profile instead
+    of re-joining (and re-tokenizing) every resume field.
+    """
+    return (
+        f"Skills: {_profile_items(resume_data, 'skills', _MAX_PROMPT_SKILLS)}\n"
+        f"Projects: {_profile_items(resume_data, 'projects', _MAX_PROMPT_ITEMS)}\n"
+        f"Experience: {_profile_items(resume_data, 'experience', _MAX_PROMPT_ITEMS)}"
+    )
+
+
+def compress_skip_profile(resume_data: dict) -> str:
+    """Build the skills/projects block for the post-skip prompt (also computed once at upload)."""
+    return (
+        f"- Skills: {_profile_items(resume_data, 'skills', _MAX_PROMPT_SKILLS)}\n"
+        f"- Projects: {_profile_items(resume_data, 'projects', _MAX_PROMPT_ITEMS)}"
+    )
+
+
 # ─────────────────────────────────────────
 # First Question (from resume)
 # ─────────────────────────────────────────
 
-def generate_first_question(resume_data: dict) -> dict:
-    """Generate the first warm-up question based on resume."""
+# Resume excerpt length for the opening question (it only needs the highlights)
+_FIRST_QUESTION_RESUME_CHARS = 3000
+
+
+async def generate_first_question(resume_text: str) -> dict:
+    """
+    Generate the first warm-up question based on the raw resume text.
+
+    Works from the text rather than the analyze_resume output so the two LLM
+    calls are independent and can run concurrently at upload time.
+    """
     client = get_client()
     if not client:
         return {"question": "Tell me about yourself and your background.", "category": "general", "topic": "introduction"}
 
-    skills = ", ".join(resume_data.get("skills", []))
-    projects = ", ".join(resume_data.get("projects", []))
-    experience = ", ".join(resume_data.get("experience", []))
-
+    resume_excerpt = resume_text[:_FIRST_QUESTION_RESUME_CHARS]
     prompt = f"""You are a very friendly, warm, and encouraging technical interviewer starting a live interview.
 
-Candidate's profile:
-- Skills: {skills}
-- Projects: {projects}
-- Experience: {experience}
+Candidate's resume (excerpt):
+{resume_excerpt}
 
 Generate one simple, friendly opening warm-up question.
 Ask them to briefly introduce themselves OR ask about something exciting from their resume
@@ -130,11 +336,8 @@ Return ONLY valid JSON:
 {{"question": "your question", "category": "general", "topic": "introduction"}}"""
 
     try:
-        text = _generate(prompt)
-        text = _clean_json(text)
-        result = json.loads(text)
-        result.setdefault("topic", "introduction")
-        return result
+        text = await _generate(prompt, tag="first_q")
+        return msgspec.structs.asdict(_decode_json(_FIRST_QUESTION_DECODER, text))
     except Exception as e:
         print(f"First question error: {e}")
         return {"question": "Tell me about yourself and your background.", "category": "general", "topic": "introduction"}
@@ -144,49 +347,65 @@ Return ONLY valid JSON:
 # CORE: Analyze Answer + Generate Next Question
 # ─────────────────────────────────────────
 
-def analyze_and_next_question(
-    resume_data: dict,
-    conversation_history: list,
-    current_topic: str,
-    topic_question_count: int,
+_CLOSING_MESSAGE = "Thank you so much for your time! That wraps up our interview. You did great!"
+
+
+# Static instructions for the per-turn prompts, sent as the system message so
+# the provider can reuse its prefix cache; only the user message (profile,
+# conversation, interview state) changes between calls
+_ANALYZE_SYSTEM = """You are a very friendly, warm, and encouraging technical interviewer conducting a LIVE adaptive interview.
+Your job is to ANALYZE the candidate's LAST answer.
+
+═══ YOUR INSTRUCTIONS ═══
+
+STEP 1 — ANALYZE the candidate's LAST answer:
+- What did they say that was CORRECT? Highlight positives first.
+- What did they get WRONG or MISS?
+- Rate their answer from 1 to 10 (be GENEROUS — give partial credit)
+- Write a clear, encouraging analysis summary
+- Always find something positive to note, even if the answer was weak.
+
+STEP 2 — DECIDE whether to END the interview (set should_end = true):
+  • IF weak_streak >= 3 AND total_questions >= 5: end gracefully and kindly.
+  • IF total_questions >= 8 AND overall performance is strong: enough ground covered.
+  • Do NOT end before asking at least 5 questions.
+  • Minimum ~5 questions, maximum ~20 questions.
+
+Return ONLY valid JSON (no extra text):
+{
+    "analysis": "Encouraging analysis — correct points first, then areas to improve",
+    "score": 7,
+    "should_end": false,
+    "end_reason": ""
+}
+"""
+
+
+async def _analyze_answer(
+    conversation_text: str,
     total_questions_asked: int,
     total_weak_streak: int,
 ) -> dict:
-    """
-    The CORE function. Analyzes the user's last answer and decides:
-    1. What was correct/wrong in the answer
-    2. Should we continue on same topic (2-3 Qs per topic) or switch?
-    3. Should we end the interview early (candidate too weak)?
-    4. Generate the next question accordingly
+    """Score the candidate's last answer and decide whether the interview should end."""
+    prompt = f"""═══ CONVERSATION SO FAR ═══
+{conversation_text}
 
-    Returns:
-    {
-        "analysis": "...",
-        "score": 7,
-        "next_question": "...",
-        "category": "...",
-        "topic": "...",
-        "should_end": false,
-        "end_reason": ""
-    }
-    """
-    client = get_client()
-    if not client:
-        return _fallback_next(resume_data, total_questions_asked, topic_question_count, current_topic)
+═══ INTERVIEW STATE ═══
+- Total questions asked in interview: {total_questions_asked}
+- Consecutive weak answers streak (before this answer): {total_weak_streak}"""
 
-    skills = ", ".join(resume_data.get("skills", []))
-    projects = ", ".join(resume_data.get("projects", []))
-    experience = ", ".join(resume_data.get("experience", []))
+    text = await _generate(prompt, tag="score", system=_ANALYZE_SYSTEM)
+    result = _decode_json(_SCORE_DECODER, text)
+    return {
+        "analysis": result.analysis,
+        "score": max(1, min(10, int(result.score))),
+        "should_end": result.should_end,
+        "end_reason": result.end_reason or "",
+    }
 
-    # Build conversation context (last 16 messages max)
-    recent = conversation_history[-16:] if len(conversation_history) > 16 else conversation_history
-    conv_text = "\n".join(
-        f"{'Interviewer' if h['role'] == 'interviewer' else 'Candidate'}: {h['content']}"
-        for h in recent
-    )
 
-    prompt = f"""You are a very friendly, warm, and encouraging technical interviewer conducting a LIVE adaptive interview.
-Your job is to ANALYZE the candidate's LAST answer and then generate an EASY next question.
+_NEXT_QUESTION_SYSTEM = """You are a very friendly, warm, and encouraging technical interviewer conducting a LIVE adaptive interview.
+Your job is to read the candidate's LAST answer and generate an EASY next question.
 
 ╔══════════════════════════════════════════════════════════════╗
 ║  CRITICAL RULE: ALL QUESTIONS MUST BE EASY & SIMPLE!        ║
@@ -211,38 +430,17 @@ Examples of BAD questions (TOO HARD — DO NOT ASK THESE):
 - "Describe the CAP theorem and its implications for distributed databases."
 - "Implement a lock-free concurrent queue."
 
-═══ CANDIDATE PROFILE ═══
-Skills: {skills}
-Projects: {projects}
-Experience: {experience}
-
-═══ CONVERSATION SO FAR ═══
-{conv_text}
-
-═══ INTERVIEW STATE ═══
-- Current topic being explored: "{current_topic}"
-- Questions asked on this topic so far: {topic_question_count}
-- Total questions asked in interview: {total_questions_asked}
-- Consecutive weak answers streak: {total_weak_streak}
-
 ═══ YOUR INSTRUCTIONS ═══
 
-STEP 1 — ANALYZE the candidate's LAST answer:
-- What did they say that was CORRECT? Highlight positives first.
-- What did they get WRONG or MISS?
-- Rate their answer from 1 to 10 (be GENEROUS — give partial credit)
-- Write a clear, encouraging analysis summary
-- Always find something positive to note, even if the answer was weak.
-
-STEP 2 — DECIDE what to do next based on these RULES:
+Judge how well the candidate handled the LAST question, then pick the next question using these RULES:
 
 RULE A — STAY ON SAME TOPIC (if topic_question_count < 3):
-  • Weak answer (score 1-4): Ask a VERY EASY follow-up on the SAME topic.
+  • Weak answer: Ask a VERY EASY follow-up on the SAME topic.
     Use simple words. Include hints or context in the question to help them.
     Example: "That's okay! Let me ask it differently — in simple terms, X is like Y. Can you tell me…?"
-  • Decent answer (score 5-7): Ask another EASY question on the SAME topic.
+  • Decent answer: Ask another EASY question on the SAME topic.
     Stay at the same basic level — do NOT increase difficulty.
-  • Great answer (score 8-10): Ask a SLIGHTLY deeper but still SIMPLE question.
+  • Great answer: Ask a SLIGHTLY deeper but still SIMPLE question.
     Keep it practical and straightforward — absolutely no trick questions.
 
 RULE B — SWITCH TOPIC (if topic_question_count >= 3):
@@ -250,82 +448,225 @@ RULE B — SWITCH TOPIC (if topic_question_count >= 3):
   • Pick something NOT yet covered in the conversation.
   • Start the new topic with the EASIEST possible introductory question.
 
-RULE C — END INTERVIEW (set should_end = true):
-  • IF weak_streak >= 3 AND total_questions >= 5: end gracefully and kindly. Thank them warmly.
-  • IF total_questions >= 8 AND overall performance is strong: enough ground covered.
-  • Do NOT end before asking at least 5 questions.
-
-RULE D — NO FIXED LIMIT:
-  • Minimum ~5 questions, maximum ~20 questions.
+RULE C — KEEP IT FRIENDLY:
   • Interview should feel like a friendly conversation, NOT an exam.
   • Be supportive, patient, and encouraging throughout.
 
 Return ONLY valid JSON (no extra text):
-{{
-    "analysis": "Encouraging analysis — correct points first, then areas to improve",
-    "score": 7,
+{
     "next_question": "Your next EASY question here",
     "category": "technical|project|behavioral|skill|general",
-    "topic": "the topic/concept this question is about",
-    "should_end": false,
-    "end_reason": ""
-}}
-
-If should_end is true, set next_question to a warm closing like "Thank you so much for your time! That wraps up our interview. You did great!"
+    "topic": "the topic/concept this question is about"
+}
 """
 
-    try:
-        text = _generate(prompt)
-        text = _clean_json(text)
-        result = json.loads(text)
-
-        # Ensure required fields
-        result.setdefault("analysis", "Answer analyzed.")
-        result.setdefault("score", 5)
-        result.setdefault("next_question", "Can you tell me more about that?")
-        result.setdefault("category", "general")
-        result.setdefault("topic", current_topic)
-        result.setdefault("should_end", False)
-        result.setdefault("end_reason", "")
-        result["score"] = min(max(int(result["score"]), 1), 10)
-
-        return result
-    except Exception as e:
-        print(f"Analyze & next question error: {e}")
-        return _fallback_next(resume_data, total_questions_asked, topic_question_count, current_topic)
 
+def _next_question_prompt(
+    resume_prompt: str,
+    conversation_text: str,
+    current_topic: str,
+    topic_question_count: int,
+    total_questions_asked: int,
+    total_weak_streak: int,
+) -> str:
+    """Build the user message for _NEXT_QUESTION_SYSTEM from the conversation so far."""
+    return f"""═══ CANDIDATE PROFILE ═══
+{resume_prompt}
 
-# ─────────────────────────────────────────
-# After Skip
-# ─────────────────────────────────────────
+═══ CONVERSATION SO FAR ═══
+{conversation_text}
+
+═══ INTERVIEW STATE ═══
+- Current topic being explored: "{current_topic}"
+- Questions asked on this topic so far: {topic_question_count}
+- Total questions asked in interview: {total_questions_asked}
+- Consecutive weak answers streak: {total_weak_streak}"""
+
+
+def _parse_next_question(text: str, current_topic: str) -> dict:
+    result = _decode_json(_NEXT_QUESTION_DECODER, text)
+    return {
+        "next_question": result.next_question,
+        "category": result.category,
+        "topic": current_topic if result.topic is None else result.topic,
+    }
 
-def generate_after_skip(
+
+async def _generate_next_question(
+    resume_prompt: str,
+    conversation_text: str,
+    current_topic: str,
+    topic_question_count: int,
+    total_questions_asked: int,
+    total_weak_streak: int,
+) -> dict:
+    """Generate the next question, judging the last answer's strength from the conversation."""
+    prompt = _next_question_prompt(
+        resume_prompt, conversation_text, current_topic,
+        topic_question_count, total_questions_asked, total_weak_streak,
+    )
+    text = await _generate(prompt, tag="next_q", system=_NEXT_QUESTION_SYSTEM)
+    return _parse_next_question(text, current_topic)
+
+
+async def analyze_and_next_question(
     resume_data: dict,
-    conversation_history: list,
+    resume_prompt: str,
+    conversation_text: str,
+    current_topic: str,
+    topic_question_count: int,
     total_questions_asked: int,
     total_weak_streak: int,
 ) -> dict:
-    """Generate next question after a skip — always switch topic."""
+    """
+    The CORE function. Analyzes the user's last answer and decides:
+    1. What was correct/wrong in the answer
+    2. Should we continue on same topic (2-3 Qs per topic) or switch?
+    3. Should we end the interview early (candidate too weak)?
+    4. Generate the next question accordingly
+
+    Scoring and next-question generation are independent prompts run
+    concurrently, so a turn costs max(analyze, generate) instead of the sum.
+
+    Returns:
+    {
+        "analysis": "...",
+        "score": 7,
+        "next_question": "...",
+        "category": "...",
+        "topic": "...",
+        "should_end": false,
+        "end_reason": ""
+    }
+    """
     client = get_client()
+    if not client:
+        return _fallback_next(resume_data, total_questions_asked, topic_question_count, current_topic)
 
-    # If too many weak/skips, end interview
-    if total_weak_streak >= 3 and total_questions_asked >= 5:
+    score_result, q_result = await asyncio.gather(
+        _analyze_answer(conversation_text, total_questions_asked, total_weak_streak),
+        _generate_next_question(
+            resume_prompt, conversation_text, current_topic,
+            topic_question_count, total_questions_asked, total_weak_streak,
+        ),
+        return_exceptions=True,
+    )
+
+    return _combine_turn(
+        score_result, q_result,
+        resume_data, total_questions_asked, topic_question_count, current_topic,
+    )
+
+
+async def stream_analyze_and_next_question(
+    resume_data: dict,
+    resume_prompt: str,
+    conversation_text: str,
+    current_topic: str,
+    topic_question_count: int,
+    total_questions_asked: int,
+    total_weak_streak: int,
+):
+    """
+    Streaming variant of analyze_and_next_question.
+
+    Yields ("question", delta) as the next question is generated, then a
+    single ("result", dict) with the same shape analyze_and_next_question
+    returns. If the analysis ends the interview, the final next_question is
+    the closing message and replaces whatever was streamed.
+    """
+    client = get_client()
+    if not client:
+        yield "result", _fallback_next(resume_data, total_questions_asked, topic_question_count, current_topic)
+        return
+
+    analysis_task = asyncio.create_task(
+        _analyze_answer(conversation_text, total_questions_asked, total_weak_streak)
+    )
+
+    prompt = _next_question_prompt(
+        resume_prompt, conversation_text, current_topic,
+        topic_question_count, total_questions_asked, total_weak_streak,
+    )
+    field = _JsonFieldStreamer("next_question")
+    parts = []
+    try:
+        try:
+            async for delta in _generate_stream(prompt, system=_NEXT_QUESTION_SYSTEM):
+                parts.append(delta)
+                question_delta = field.feed(delta)
+                if question_delta:
+                    yield "question", question_delta
+            q_result = _parse_next_question("".join(parts), current_topic)
+        except Exception as e:
+            q_result = e
+
+        try:
+            score_result = await analysis_task
+        except Exception as e:
+            score_result = e
+
+        yield "result", _combine_turn(
+            score_result, q_result,
+            resume_data, total_questions_asked, topic_question_count, current_topic,
+        )
+    finally:
+        # Client went away mid-stream: don't leave the analysis call running
+        if not analysis_task.done():
+            analysis_task.cancel()
+
+
+def _combine_turn(
+    score_result,
+    q_result,
+    resume_data: dict,
+    total_questions_asked: int,
+    topic_question_count: int,
+    current_topic: str,
+) -> dict:
+    """Merge the analysis and next-question results, falling back on errors."""
+    if isinstance(score_result, BaseException):
+        print(f"Analyze answer error: {score_result}")
+        return _fallback_next(resume_data, total_questions_asked, topic_question_count, current_topic)
+
+    # The question is discarded when the analysis decides to end the interview
+    if score_result["should_end"]:
         return {
-            "analysis": "Candidate skipped again with too many weak responses.",
-            "score": 0,
-            "next_question": "Thank you for your time. That concludes our interview.",
+            **score_result,
+            "next_question": _CLOSING_MESSAGE,
             "category": "general",
             "topic": "closing",
-            "should_end": True,
-            "end_reason": "Too many consecutive skips and weak answers"
         }
 
-    if not client:
-        return _fallback_next(resume_data, total_questions_asked, 0, "new")
+    if isinstance(q_result, BaseException):
+        print(f"Next question error: {q_result}")
+        q_result = _fallback_next(resume_data, total_questions_asked, topic_question_count, current_topic)
+
+    return {
+        **score_result,
+        "next_question": q_result["next_question"],
+        "category": q_result["category"],
+        "topic": q_result["topic"],
+    }
+
+
+# ─────────────────────────────────────────
+# After Skip
+# ─────────────────────────────────────────
+
+_SKIP_LIMIT_RESULT = {
+    "analysis": "Candidate skipped again with too many weak responses.",
+    "score": 0,
+    "next_question": "Thank you for your time. That concludes our interview.",
+    "category": "general",
+    "topic": "closing",
+    "should_end": True,
+    "end_reason": "Too many consecutive skips and weak answers"
+}
 
-    skills = ", ".join(resume_data.get("skills", []))
-    projects = ", ".join(resume_data.get("projects", []))
 
+def _skip_prompt(skip_profile: str, conversation_history: Iterable[dict], total_questions_asked: int) -> str:
+    """Build the post-skip prompt."""
     asked_qs = [h["content"] for h in conversation_history if h["role"] == "interviewer"]
     asked_text = "\n- ".join(asked_qs[-8:]) if asked_qs else "None"
 
@@ -333,8 +674,7 @@ def generate_after_skip(
 That's totally fine! Move to a COMPLETELY DIFFERENT topic from their resume.
 
 Profile:
-- Skills: {skills}
-- Projects: {projects}
+{skip_profile}
 
 Questions already asked:
 - {asked_text}
@@ -357,24 +697,86 @@ Examples of good post-skip questions:
 Return ONLY valid JSON:
 {{"next_question": "your EASY question", "category": "technical|project|behavioral|skill|general", "topic": "the new topic"}}"""
 
+    return prompt
+
+
+def _parse_skip(text: str) -> dict:
+    result = _decode_json(_SKIP_DECODER, text)
+    return {
+        "analysis": "Candidate skipped — moving to different topic.",
+        "score": 0,
+        "next_question": result.next_question,
+        "category": result.category,
+        "topic": result.topic,
+        "should_end": False,
+        "end_reason": ""
+    }
+
+
+async def generate_after_skip(
+    resume_data: dict,
+    skip_profile: str,
+    conversation_history: Iterable[dict],
+    total_questions_asked: int,
+    total_weak_streak: int,
+) -> dict:
+    """Generate next question after a skip — always switch topic."""
+    client = get_client()
+
+    # If too many weak/skips, end interview
+    if total_weak_streak >= 3 and total_questions_asked >= 5:
+        return dict(_SKIP_LIMIT_RESULT)
+
+    if not client:
+        return _fallback_next(resume_data, total_questions_asked, 0, "new")
+
+    prompt = _skip_prompt(skip_profile, conversation_history, total_questions_asked)
     try:
-        text = _generate(prompt)
-        text = _clean_json(text)
-        result = json.loads(text)
-        return {
-            "analysis": "Candidate skipped — moving to different topic.",
-            "score": 0,
-            "next_question": result.get("next_question", "Tell me about another project you worked on."),
-            "category": result.get("category", "general"),
-            "topic": result.get("topic", "new_topic"),
-            "should_end": False,
-            "end_reason": ""
-        }
+        # Exact match only: the asked-questions list must rule out repeats
+        text = await _generate(prompt, tag="skip")
+        return _parse_skip(text)
     except Exception as e:
         print(f"Skip question error: {e}")
         return _fallback_next(resume_data, total_questions_asked, 0, "new")
 
 
+async def stream_after_skip(
+    resume_data: dict,
+    skip_profile: str,
+    conversation_history: Iterable[dict],
+    total_questions_asked: int,
+    total_weak_streak: int,
+):
+    """
+    Streaming variant of generate_after_skip.
+
+    Yields ("question", delta) as the new question is generated, then a
+    single ("result", dict) with the same shape generate_after_skip returns.
+    """
+    if total_weak_streak >= 3 and total_questions_asked >= 5:
+        yield "result", dict(_SKIP_LIMIT_RESULT)
+        return
+
+    if not get_client():
+        yield "result", _fallback_next(resume_data, total_questions_asked, 0, "new")
+        return
+
+    prompt = _skip_prompt(skip_profile, conversation_history, total_questions_asked)
+    field = _JsonFieldStreamer("next_question")
+    parts = []
+    try:
+        async for delta in _generate_stream(prompt):
+            parts.append(delta)
+            question_delta = field.feed(delta)
+            if question_delta:
+                yield "question", question_delta
+        result = _parse_skip("".join(parts))
+    except Exception as e:
+        print(f"Skip question error: {e}")
+        result = _fallback_next(resume_data, total_questions_asked, 0, "new")
+    yield "result", result
+
+
 def _fallback_next(resume_data: dict, q_num: int, topic_count: int, current_topic: str) -> dict:
     """Fallback when LLM unavailable."""
     skills = resume_data.get("skills", ["programming"])
@@ -0,0 +1,40 @@
+"""
+In-memory cache for LLM completions.
+
+Exact repeats of a prompt (within a tag) are served from an LRU, so an
+identical request skips the API round trip. Only exact matches are reused:
+completions here are personalised to a candidate or answer, and
+near-duplicate matching would hand one request's output to another.
+"""
+
+from collections import OrderedDict
+from typing import Optional
+
+
+class LLMCache:
+    """LRU of (tag, prompt) -> completion."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+
+    def get(self, prompt: str, tag: str = "") -> Optional[str]:
+        """Return the cached completion for an identical prompt."""
+        key = (tag, prompt)
+        completion = self._entries.get(key)
+        if completion is not None:
+            self._entries.move_to_end(key)
+        return completion
+
+    def put(self, prompt: str, completion: str, tag: str = ""):
+        """Store a completion, evicting the least recently used entry if full."""
+        if not completion:
+            return
+        key = (tag, prompt)
+        self._entries[key] = completion
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
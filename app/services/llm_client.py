@@ -0,0 +1,155 @@
+"""
+Shared NVIDIA (OpenAI-compatible) API client.
+
+Chat completions are POSTed directly with one httpx.AsyncClient backed by a
+single HTTP/2 connection pool, so concurrent LLM calls from every engine
+multiplex over warm connections. create_completion / stream_completion bound
+in-flight requests and retry transient rate-limit / timeout / 5xx errors with
+jittered exponential backoff.
+"""
+
+import asyncio
+from typing import AsyncIterator, List, Optional
+
+import httpx
+import msgspec
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from ..core.config import settings
+
+_client: Optional[httpx.AsyncClient] = None
+
+# Caps concurrent requests to the provider so bursts don't trigger 429 storms
+_semaphore = asyncio.Semaphore(settings.NVIDIA_MAX_PARALLEL)
+
+
+def get_client() -> Optional[httpx.AsyncClient]:
+    """Return the shared LLM HTTP client, or None when no API key is configured."""
+    global _client
+    if _client is None and settings.NVIDIA_API_KEY and settings.NVIDIA_API_KEY != "your_nvidia_api_key_here":
+        _client = httpx.AsyncClient(
+            base_url=settings.NVIDIA_BASE_URL,
+            headers={"Authorization": f"Bearer {settings.NVIDIA_API_KEY}"},
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=30,
+        )
+    return _client
+
+
+async def warm_up():
+    """Create the client and open a pooled connection before the first user request."""
+    client = get_client()
+    if not client:
+        return
+    try:
+        await client.get("/models", timeout=5)
+    except Exception as e:
+        print(f"LLM warm-up failed: {e}")
+
+
+async def close_client():
+    """Close the shared client's connection pool (on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Only the fields we read are declared, so decoding skips id/usage/logprobs/etc.
+class _Message(msgspec.Struct):
+    content: Optional[str] = None
+
+
+class _Choice(msgspec.Struct):
+    message: _Message = msgspec.field(default_factory=_Message)
+
+
+class _ChatResponse(msgspec.Struct):
+    choices: List[_Choice] = []
+
+
+class _Delta(msgspec.Struct):
+    content: Optional[str] = None
+
+
+class _StreamChoice(msgspec.Struct):
+    delta: _Delta = msgspec.field(default_factory=_Delta)
+
+
+class _StreamChunk(msgspec.Struct):
+    choices: List[_StreamChoice] = []
+
+
+_encoder = msgspec.json.Encoder()
+_response_decoder = msgspec.json.Decoder(_ChatResponse)
+_chunk_decoder = msgspec.json.Decoder(_StreamChunk)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _is_transient(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code == 429 or exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+_retry = retry(
+    retry=retry_if_exception(_is_transient),
+    wait=wait_exponential_jitter(max=4),
+    stop=stop_after_attempt(3),
+    reraise=True,
+)
+
+
+@_retry
+async def create_completion(client: httpx.AsyncClient, **payload) -> str:
+    """POST /chat/completions and return the first choice's message content."""
+    async with _semaphore:
+        response = await client.post(
+            "/chat/completions", content=_encoder.encode(payload), headers=_JSON_HEADERS
+        )
+    response.raise_for_status()
+    choices = _response_decoder.decode(response.content).choices
+    return (choices[0].message.content or "") if choices else ""
+
+
+async def stream_completion(client: httpx.AsyncClient, **payload) -> AsyncIterator[str]:
+    """POST /chat/completions with stream=True and yield content deltas.
+
+    The concurrency slot is held until the stream is fully consumed or
+    closed; only opening the stream is retried.
+    """
+    async with _semaphore:
+        response = await _open_stream(client, payload)
+        try:
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = _chunk_decoder.decode(data).choices
+                delta = choices[0].delta.content if choices else None
+                if delta:
+                    yield delta
+        finally:
+            await response.aclose()
+
+
+@_retry
+async def _open_stream(client: httpx.AsyncClient, payload: dict) -> httpx.Response:
+    request = client.build_request(
+        "POST", "/chat/completions",
+        content=_encoder.encode({**payload, "stream": True}), headers=_JSON_HEADERS,
+    )
+    response = await client.send(request, stream=True)
+    if response.is_error:
+        await response.aread()
+        await response.aclose()
+        response.raise_for_status()
+    return response
@@ -1,10 +1,28 @@
-import time
-from typing import Dict, List, Optional
+import asyncio
+import itertools
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 import uuid
 
+import msgspec
+from ..core.redis_client import get_redis
 
-@dataclass
+# Number of recent messages kept in the prompt-ready history window
+HISTORY_WINDOW = 16
+
+# Number of raw history messages kept per session (the skip prompt only
+# looks at the last few interviewer questions)
+CONVERSATION_WINDOW = 32
+
+# Sessions in Redis expire after this long without a write
+SESSION_TTL = 3600
+
+# Max session writes sent to Redis in one pipeline
+WRITE_BATCH = 32
+
+
+@dataclass(slots=True)
 class QuestionRecord:
     question_number: int
     question: str
@@ -15,122 +33,249 @@ class QuestionRecord:
     skipped: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class InterviewSession:
     session_id: str
     resume_text: str = ""
     resume_summary: dict = field(default_factory=dict)
+    resume_prompt: str = ""  # compact profile block reused in every turn's prompt
+    skip_profile: str = ""  # skills/projects block for the post-skip prompt
+    first_question: dict = field(default_factory=dict)  # prepared at upload
     questions: List[QuestionRecord] = field(default_factory=list)
     current_question_index: int = 0
     started: bool = False
     finished: bool = False
     start_time: float = 0
     end_time: float = 0
-    conversation_history: List[dict] = field(default_factory=list)
+    conversation_history: Deque[dict] = field(default_factory=lambda: deque(maxlen=CONVERSATION_WINDOW))
+    # Maintained incrementally so a turn doesn't rescan the whole session
+    question_count: int = 0
+    history_tail: Deque[str] = field(default_factory=lambda: deque(maxlen=HISTORY_WINDOW))
     # Adaptive interview tracking
     current_topic: str = "introduction"
     topic_question_count: int = 0
     weak_streak: int = 0
 
 
-# In-memory session storage
+# Sessions live in Redis when REDIS_URL is set, so every worker sees the same
+# interviews and restarts don't drop them. Otherwise they stay in this dict.
 _sessions: Dict[str, InterviewSession] = {}
 
+# msgpack has no deque type: the bounded histories go over the wire as lists
+_encoder = msgspec.msgpack.Encoder(enc_hook=list)
+_DEQUE_MAXLEN = {Deque[str]: HISTORY_WINDOW, Deque[dict]: CONVERSATION_WINDOW}
+
+
+def _dec_hook(type_, obj):
+    if type_ in _DEQUE_MAXLEN:
+        return deque(obj, maxlen=_DEQUE_MAXLEN[type_])
+    raise NotImplementedError(f"Unsupported type: {type_}")
+
+
+_decoder = msgspec.msgpack.Decoder(InterviewSession, dec_hook=_dec_hook)
 
-def create_session() -> str:
-    """Create a new interview session."""
+
+def _key(session_id: str) -> str:
+    return f"sess:{session_id}"
+
+
+def create_session() -> InterviewSession:
+    """Create a new interview session (persisted by the first save_session)."""
     session_id = str(uuid.uuid4())[:8]
-    _sessions[session_id] = InterviewSession(session_id=session_id)
-    return session_id
+    return InterviewSession(session_id=session_id)
+
 
+# Redis writes happen in a background task so requests don't wait on them.
+# Until a write lands, the saved session is served from _pending (keyed by
+# session_id, tagged with a save sequence number) so this worker always
+# reads its own latest state.
+_pending: Dict[str, Tuple[int, InterviewSession]] = {}
+_save_seq = itertools.count()
+_write_queue: Optional[asyncio.Queue] = None
+_writer_task: Optional[asyncio.Task] = None
 
-def get_session(session_id: str) -> Optional[InterviewSession]:
+
+async def get_session(session_id: str) -> Optional[InterviewSession]:
     """Get an existing session."""
-    return _sessions.get(session_id)
+    redis = get_redis()
+    if not redis:
+        return _sessions.get(session_id)
+    pending = _pending.get(session_id)
+    if pending:
+        return pending[1]
+    raw = await redis.get(_key(session_id))
+    return _decoder.decode(raw) if raw else None
+
+
+async def save_session(session: InterviewSession):
+    """Persist a session after a request has finished changing it."""
+    redis = get_redis()
+    if not redis:
+        _sessions[session.session_id] = session
+        return
+    _pending[session.session_id] = (next(_save_seq), session)
+    _ensure_writer()
+    _write_queue.put_nowait(session.session_id)
+
 
+def _ensure_writer():
+    global _write_queue, _writer_task
+    if _writer_task is None or _writer_task.done():
+        _write_queue = asyncio.Queue()
+        _writer_task = asyncio.get_running_loop().create_task(_writer_loop())
+        # Sessions saved before a previous writer stopped still need writing
+        for session_id in _pending:
+            _write_queue.put_nowait(session_id)
 
-def update_session(session_id: str, **kwargs):
-    """Update session fields in memory."""
-    session = _sessions.get(session_id)
-    if session:
-        for key, value in kwargs.items():
-            if hasattr(session, key):
-                setattr(session, key, value)
 
+async def _writer_loop():
+    while True:
+        session_ids = {await _write_queue.get()}
+        while len(session_ids) < WRITE_BATCH and not _write_queue.empty():
+            session_ids.add(_write_queue.get_nowait())
+        await _write_sessions(session_ids)
 
-def add_question(session_id: str, question: str, category: str) -> int:
+
+async def _write_sessions(session_ids):
+    """Write the latest saved state of each session in one pipeline."""
+    batch = {sid: _pending[sid] for sid in session_ids if sid in _pending}
+    if not batch:
+        return
+    pipe = get_redis().pipeline(transaction=False)
+    for sid, (_, session) in batch.items():
+        pipe.set(_key(sid), _encoder.encode(session), ex=SESSION_TTL)
+    try:
+        await pipe.execute()
+    except Exception as e:
+        # Keep them pending (still served locally) and retry shortly
+        print(f"Session write error: {e}")
+        await asyncio.sleep(1)
+        for sid in batch:
+            _write_queue.put_nowait(sid)
+        return
+    for sid, (seq, _) in batch.items():
+        # A save that arrived mid-write has a newer seq and is queued again
+        if _pending.get(sid, (None,))[0] == seq:
+            del _pending[sid]
+
+
+async def flush_sessions():
+    """Write out every pending session and stop the writer (on app shutdown)."""
+    global _writer_task
+    if _writer_task is not None:
+        _writer_task.cancel()
+        _writer_task = None
+    if _pending and get_redis():
+        await _write_sessions(set(_pending))
+
+
+def update_session(session: InterviewSession, **kwargs):
+    """Update session fields."""
+    for key, value in kwargs.items():
+        if hasattr(session, key):
+            setattr(session, key, value)
+
+
+def add_question(session: InterviewSession, question: str, category: str) -> int:
     """Add a question to the session. Returns question number."""
-    session = _sessions.get(session_id)
-    if session:
-        q_num = len(session.questions) + 1
-        session.questions.append(QuestionRecord(
-            question_number=q_num,
-            question=question,
-            category=category
-        ))
-        return q_num
-    return 0
-
-
-def record_answer(session_id: str, answer: str, score: int, feedback: str):
+    q_num = session.question_count + 1
+    session.questions.append(QuestionRecord(
+        question_number=q_num,
+        question=question,
+        category=category
+    ))
+    session.question_count = q_num
+    return q_num
+
+
+def record_answer(session: InterviewSession, answer: str, score: int, feedback: str):
     """Record an answer for the current question."""
-    session = _sessions.get(session_id)
-    if session and session.questions:
+    if session.questions:
         idx = session.current_question_index
-        if idx < len(session.questions):
+        if idx < session.question_count:
             session.questions[idx].answer = answer
             session.questions[idx].score = score
             session.questions[idx].feedback = feedback
             session.current_question_index += 1
 
 
-def record_skip(session_id: str):
+def record_skip(session: InterviewSession):
     """Record a skipped question."""
-    session = _sessions.get(session_id)
-    if session and session.questions:
+    if session.questions:
         idx = session.current_question_index
-        if idx < len(session.questions):
+        if idx < session.question_count:
             session.questions[idx].skipped = True
             session.current_question_index += 1
 
 
-def add_to_history(session_id: str, role: str, content: str):
+def _history_line(role: str, content: str) -> str:
+    speaker = "Interviewer" if role == "interviewer" else "Candidate"
+    return f"{speaker}: {content}"
+
+
+def add_to_history(session: InterviewSession, role: str, content: str):
     """Add to conversation history."""
-    session = _sessions.get(session_id)
-    if session:
-        session.conversation_history.append({"role": role, "content": content})
+    session.conversation_history.append({"role": role, "content": content})
+    session.history_tail.append(_history_line(role, content))
+
+
+def history_text_with(session: InterviewSession, role: str, content: str) -> str:
+    """Recent history as prompt text, including a line not yet added to the session."""
+    tail = list(session.history_tail)[-(HISTORY_WINDOW - 1):]
+    tail.append(_history_line(role, content))
+    return "\n".join(tail)
+
+
+def _question_to_dict(q: QuestionRecord) -> dict:
+    return {
+        "question_number": q.question_number,
+        "question": q.question,
+        "category": q.category,
+        "answer": q.answer,
+        "score": q.score,
+        "feedback": q.feedback,
+        "skipped": q.skipped,
+    }
 
 
-def get_session_report(session_id: str) -> Optional[dict]:
+def get_session_report(session: InterviewSession) -> dict:
     """Generate a report for the session."""
-    session = _sessions.get(session_id)
-    if not session:
-        return None
-
-    answered = [q for q in session.questions if not q.skipped and q.answer]
-    skipped = [q for q in session.questions if q.skipped]
-
-    # Only consider technical / skill / project answers for "best answer"
-    # Exclude generic intro/general/behavioral questions
-    technical_answered = [
-        q for q in answered
-        if q.category in ("technical", "skill", "project")
-        and q.score >= 6
-    ]
-    best_answer = max(technical_answered, key=lambda q: q.score) if technical_answered else None
-    worst_answer = min(answered, key=lambda q: q.score) if answered else None
-    avg_score = sum(q.score for q in answered) / len(answered) if answered else 0
+    # Single pass over the questions for counts, score sum and best/worst
+    answered = 0
+    skipped = 0
+    score_sum = 0
+    best_answer = None
+    worst_answer = None
+    for q in session.questions:
+        if q.skipped:
+            skipped += 1
+            continue
+        if not q.answer:
+            continue
+        answered += 1
+        score_sum += q.score
+        if worst_answer is None or q.score < worst_answer.score:
+            worst_answer = q
+        # Only consider technical / skill / project answers for "best answer"
+        # Exclude generic intro/general/behavioral questions
+        if (
+            q.category in ("technical", "skill", "project")
+            and q.score >= 6
+            and (best_answer is None or q.score > best_answer.score)
+        ):
+            best_answer = q
+    avg_score = score_sum / answered if answered else 0
 
     duration = int(session.end_time - session.start_time) if session.end_time else 0
 
     return {
-        "session_id": session_id,
+        "session_id": session.session_id,
         "total_questions": len(session.questions),
-        "answered": len(answered),
-        "skipped": len(skipped),
+        "answered": answered,
+        "skipped": skipped,
         "average_score": round(avg_score, 1),
-        "best_answer": best_answer.__dict__ if best_answer else None,
-        "worst_answer": worst_answer.__dict__ if worst_answer else None,
-        "results": [q.__dict__ for q in session.questions],
+        "best_answer": _question_to_dict(best_answer) if best_answer else None,
+        "worst_answer": _question_to_dict(worst_answer) if worst_answer else None,
+        "results": [_question_to_dict(q) for q in session.questions],
         "duration_seconds": duration
     }
\ No newline at end of file
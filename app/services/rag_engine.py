@@ -3,42 +3,39 @@ Simple in-memory RAG engine using keyword-based text retrieval.
 Stores resume chunks and retrieves relevant context for interview questions.
 """
 
+import heapq
 import math
-from typing import Dict, List
-from collections import Counter
+import re
+from typing import Dict, List, Tuple
+from collections import Counter, defaultdict
 
-# In-memory storage: session_id -> list of text chunks
-_store: Dict[str, List[str]] = {}
+# In-memory storage: session_id -> {"chunks", "index", "norms"}
+# index maps token -> [(chunk_idx, count)], so a query only touches chunks
+# sharing at least one of its tokens; norms are the chunks' L2 norms.
+_store: Dict[str, dict] = {}
+
+_TOKEN_RE = re.compile(r'[A-Za-z]+')
 
 
 def _tokenize(text: str) -> List[str]:
     """Simple tokenization: lowercase, split on non-alpha."""
-    import re
-    return re.findall(r'[a-zA-Z]+', text.lower())
-
-
-def _compute_similarity(query_tokens: List[str], doc_tokens: List[str]) -> float:
-    """Compute simple cosine similarity between token sets."""
-    if not query_tokens or not doc_tokens:
-        return 0.0
-
-    query_counts = Counter(query_tokens)
-    doc_counts = Counter(doc_tokens)
+    return _TOKEN_RE.findall(text.lower())
 
-    all_tokens = set(query_counts.keys()) | set(doc_counts.keys())
 
-    dot_product = sum(query_counts.get(t, 0) * doc_counts.get(t, 0) for t in all_tokens)
-    q_norm = math.sqrt(sum(v ** 2 for v in query_counts.values()))
-    d_norm = math.sqrt(sum(v ** 2 for v in doc_counts.values()))
-
-    if q_norm == 0 or d_norm == 0:
-        return 0.0
-
-    return dot_product / (q_norm * d_norm)
+def _build_index(chunks: List[str]) -> Tuple[Dict[str, List[Tuple[int, int]]], List[float]]:
+    """Count tokens for every chunk once and build the inverted index + norms."""
+    index: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+    norms = []
+    for i, chunk in enumerate(chunks):
+        counts = Counter(_tokenize(chunk))
+        for token, count in counts.items():
+            index[token].append((i, count))
+        norms.append(math.hypot(*counts.values()))
+    return dict(index), norms
 
 
 def store_resume_chunks(session_id: str, text: str, chunk_size: int = 100):
-    """Split resume text into chunks and store in memory."""
+    """Split resume text into chunks, index them and store in memory."""
     words = text.split()
     chunks = []
     step = max(chunk_size, 1)
@@ -51,27 +48,37 @@ def store_resume_chunks(session_id: str, text: str, chunk_size: int = 100):
     if not chunks:
         chunks = [text]
 
-    _store[session_id] = chunks
+    index, norms = _build_index(chunks)
+    _store[session_id] = {"chunks": chunks, "index": index, "norms": norms}
 
 
 def retrieve_context(session_id: str, query: str, n_results: int = 3) -> str:
-    """Retrieve relevant resume context for a query."""
-    chunks = _store.get(session_id, [])
-    if not chunks:
+    """Retrieve relevant resume context for a query (cosine over token counts)."""
+    entry = _store.get(session_id)
+    if not entry:
         return ""
+    chunks = entry["chunks"]
 
-    query_tokens = _tokenize(query)
+    query_counts = Counter(_tokenize(query))
+    q_norm = math.hypot(*query_counts.values())
 
-    scored = []
-    for chunk in chunks:
-        doc_tokens = _tokenize(chunk)
-        score = _compute_similarity(query_tokens, doc_tokens)
-        scored.append((score, chunk))
+    # Accumulate dot products through the inverted index
+    dots = [0] * len(chunks)
+    if q_norm:
+        index = entry["index"]
+        for token, q_count in query_counts.items():
+            for i, count in index.get(token, ()):
+                dots[i] += q_count * count
 
-    scored.sort(key=lambda x: x[0], reverse=True)
+    norms = entry["norms"]
+    scores = [
+        dots[i] / (q_norm * norms[i]) if dots[i] else 0.0
+        for i in range(len(chunks))
+    ]
 
-    top_chunks = [chunk for _, chunk in scored[:n_results]]
-    return "\n".join(top_chunks)
+    # Stable top-k: ties keep chunk order, as the previous full sort did
+    top = heapq.nlargest(n_results, range(len(chunks)), key=lambda i: (scores[i], -i))
+    return "\n".join(chunks[i] for i in top)
 
 
 def cleanup_session(session_id: str):
@@ -81,5 +88,5 @@ def cleanup_session(session_id: str):
 
 def get_full_resume_text(session_id: str) -> str:
     """Get the full resume text for a session."""
-    chunks = _store.get(session_id, [])
-    return " ".join(chunks)
\ No newline at end of file
+    entry = _store.get(session_id)
+    return " ".join(entry["chunks"]) if entry else ""
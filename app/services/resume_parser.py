@@ -1,16 +1,49 @@
+import asyncio
+import multiprocessing
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
 from PyPDF2 import PdfReader
+from ..core.config import settings
+
+# PDF parsing is CPU-bound pure Python, so it runs in a small pool of worker
+# processes (created on first use) to keep it off the event loop and out of
+# the GIL. The pool is per app worker, hence the small fixed size, and its
+# processes are started fresh rather than forked from this threaded process.
+_pdf_pool: Optional[ProcessPoolExecutor] = None
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
 
 
 def extract_text_from_pdf(file_path: str) -> str:
     """Extract text from a PDF file."""
     reader = PdfReader(file_path)
-    text = ""
+    parts = []
     for page in reader.pages:
         page_text = page.extract_text()
         if page_text:
-            text += page_text + "\n"
-    return text.strip()
+            parts.append(page_text)
+    return "\n".join(parts).strip()
+
+
+async def extract_text_from_pdf_async(file_path: str) -> str:
+    """Extract text from a PDF file in the parser process pool."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        _pdf_pool = ProcessPoolExecutor(
+            max_workers=settings.PDF_WORKERS,
+            mp_context=multiprocessing.get_context(_START_METHOD),
+        )
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_pdf_pool, extract_text_from_pdf, file_path)
+
+
+def shutdown_pdf_pool():
+    """Stop the parser worker processes (on app shutdown)."""
+    global _pdf_pool
+    if _pdf_pool is not None:
+        _pdf_pool.shutdown(cancel_futures=True)
+        _pdf_pool = None
 
 
 def save_resume(file_content: bytes, filename: str, upload_dir: str) -> str:
@@ -19,4 +52,9 @@ def save_resume(file_content: bytes, filename: str, upload_dir: str) -> str:
     file_path = os.path.join(upload_dir, filename)
     with open(file_path, "wb") as f:
         f.write(file_content)
-    return file_path
\ No newline at end of file
+    return file_path
+
+
+async def save_resume_async(file_content: bytes, filename: str, upload_dir: str) -> str:
+    """Save uploaded resume to disk from a worker thread and return the file path."""
+    return await asyncio.to_thread(save_resume, file_content, filename, upload_dir)
@@ -0,0 +1,34 @@
+"""
+Merging of identical in-flight LLM requests.
+
+When a request arrives while an identical one is already running (e.g. a
+report opened twice as a session finishes), the caller awaits the running
+call instead of starting another. Nothing is delayed: distinct requests go
+straight out, bounded by llm_client's semaphore.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Runs `handler(*args)` at most once at a time per distinct args."""
+
+    def __init__(self, handler: Callable[..., Awaitable[str]]):
+        self._handler = handler
+        # args -> running task; holding the task here also keeps it referenced
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+
+    async def submit(self, *args) -> str:
+        """Run the request, or join an identical one already running."""
+        task = self._inflight.get(args)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._handler(*args))
+            self._inflight[args] = task
+            task.add_done_callback(lambda t, key=args: self._forget(key, t))
+        # Shield so one caller going away doesn't cancel the call for the others
+        return await asyncio.shield(task)
+
+    def _forget(self, key: tuple, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]